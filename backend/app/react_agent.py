@@ -1,15 +1,20 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain_openai import AzureChatOpenAI
+from langchain_core.caches import InMemoryCache
 from langchain_core.messages import SystemMessage
 from langgraph.prebuilt import create_react_agent
 from .tools import (
     get_weather,
+    get_weather_batch,
     get_stock_price,
     get_nps_score,
     get_deep_detraction_rate,
     get_churn_rate,
     get_churn_reasons,
+    get_all_churn_rates,
+    get_all_churn_reasons,
     generate_chart_data,
     create_custom_dataset,
     get_sample_sales_data,
@@ -21,42 +26,49 @@ from .tools import (
 
 load_dotenv()
 
-llm = AzureChatOpenAI(
-    openai_api_version=os.environ.get("AZURE_OPENAI_API_VERSION", "2023-07-01-preview"),
-    azure_deployment=os.environ.get("AZURE_OPENAI_DEPLOYMENT", "gpt35"),
-    azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT", "https://<your-endpoint>.openai.azure.com/"),
-    api_key=os.environ.get("AZURE_OPENAI_KEY")
-)
+# Chart generation and sample data tools can be switched off with ENABLE_CHARTS=0
+ENABLE_CHARTS = os.environ.get("ENABLE_CHARTS", "1") == "1"
 
 # Tools are now imported from the tools package
 tools = [
     get_weather, 
+    get_weather_batch, 
     get_stock_price, 
     get_nps_score, 
     get_deep_detraction_rate, 
     get_churn_rate, 
     get_churn_reasons,
-    generate_chart_data,
-    create_custom_dataset,
-    get_sample_sales_data,
-    get_sample_market_share_data,
-    get_sample_performance_metrics,
-    get_sample_time_series_data,
-    get_sample_scatter_data
+    get_all_churn_rates,
+    get_all_churn_reasons
 ]
+if ENABLE_CHARTS:
+    tools += [
+        generate_chart_data,
+        create_custom_dataset,
+        get_sample_sales_data,
+        get_sample_market_share_data,
+        get_sample_performance_metrics,
+        get_sample_time_series_data,
+        get_sample_scatter_data
+    ]
 
-SYSTEM_PROMPT = """You are a helpful assistant with advanced data visualization capabilities.
+_BASE_PROMPT = """
 
 You are able to call the following tools:
 
 **Data Retrieval Tools:**
 - get_weather: Get current weather information for a city, including temperature, conditions, humidity, wind, UV index, and air quality
+- get_weather_batch: Get current weather information for several cities in one call. Use this instead of several get_weather calls when the user asks about more than one city.
 - get_stock_price: Get current stock price and related information for a stock symbol. This is a mocked function and only supports 'AAPL'.
 - get_nps_score: Get the Net Promoter Score (NPS) for Vodafone in a given country. This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
 - get_deep_detraction_rate: Get the Deep Detraction Rate and a historical trend for Vodafone in a given country. This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
 - get_churn_rate: Get the Churn Rate and a historical trend for Vodafone in a given country. This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
 - get_churn_reasons: Get detailed reasons why customers are churning for Vodafone in a given country, including breakdown by percentage, severity, and trends. This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
+- get_all_churn_rates: Get the Churn Rate for all supported countries (UK, DE, PT) in one call. Use this instead of several get_churn_rate calls when comparing countries.
+- get_all_churn_reasons: Get the churn reasons for all supported countries (UK, DE, PT) in one call. Use this instead of several get_churn_reasons calls when comparing countries.
+"""
 
+_CHART_PROMPT_SUFFIX = """
 **Universal Chart Generation Tools:**
 - generate_chart_data: Transform any structured dataset into chart-ready format with automatic data structure inference. Supports line charts, bar charts, pie charts, scatter plots, and multi-series charts. Can automatically detect optimal chart types and field mappings.
 - create_custom_dataset: Create structured datasets on the fly that can be used for charting. Useful for creating sample data or transforming existing data into chartable format.
@@ -97,6 +109,33 @@ When working with data visualization:
 - For demos and examples, use the sample data generation tools to create realistic datasets
 """
 
+if ENABLE_CHARTS:
+    SYSTEM_PROMPT = "You are a helpful assistant with advanced data visualization capabilities." + _BASE_PROMPT + _CHART_PROMPT_SUFFIX
+else:
+    SYSTEM_PROMPT = "You are a helpful assistant." + _BASE_PROMPT
+
 system_message = SystemMessage(content=SYSTEM_PROMPT)
-agent_executor = create_react_agent(llm, tools, messages_modifier=system_message)
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> AzureChatOpenAI:
+    """Return the process-wide Azure OpenAI chat client, created on first use."""
+    prompt_cache_key = os.environ.get("AZURE_OPENAI_PROMPT_CACHE_KEY")
+    return AzureChatOpenAI(
+        openai_api_version=os.environ.get("AZURE_OPENAI_API_VERSION", "2023-07-01-preview"),
+        azure_deployment=os.environ.get("AZURE_OPENAI_DEPLOYMENT", "gpt35"),
+        azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT", "https://<your-endpoint>.openai.azure.com/"),
+        api_key=os.environ.get("AZURE_OPENAI_KEY"),
+        # Every request starts with the same static system prompt; a stable key lets
+        # deployments that support prompt caching route them to the same cache
+        extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
+        # Optional exact-match cache for repeated identical conversations
+        cache=InMemoryCache(maxsize=1024) if os.environ.get("LLM_RESPONSE_CACHE") == "1" else None
+    )
+
+
+@lru_cache(maxsize=1)
+def get_agent_executor():
+    """Return the compiled React agent graph, built once per process on first use."""
+    return create_react_agent(get_llm(), tools, messages_modifier=system_message)
 
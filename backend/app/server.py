@@ -1,7 +1,8 @@
+import os
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from langserve import add_routes
-from .react_agent import agent_executor
+from .react_agent import get_agent_executor
 from pydantic import BaseModel
 from typing import List, Union
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
@@ -19,7 +20,11 @@ async def redirect_root_to_docs():
 
 
 # Edit this to add the chain you want to add
-prebuilt_react_agent_runnable = agent_executor.with_types(input_type=ChatInputType)
+# max_concurrency bounds how many inputs of a /agent/batch request run at once,
+# keeping bursts within the Azure OpenAI deployment's tokens-per-minute quota
+prebuilt_react_agent_runnable = get_agent_executor().with_types(input_type=ChatInputType).with_config(
+    max_concurrency=int(os.environ.get("AGENT_MAX_CONCURRENCY", "10"))
+)
 add_routes(app, prebuilt_react_agent_runnable, path="/agent")
 
 if __name__ == "__main__":
@@ -9,9 +9,9 @@ This package contains all tool functions organized by domain:
 - data_samples: Sample data generation tools for testing chart functionality
 """
 
-from .demo import get_weather, get_stock_price
+from .demo import get_weather, get_weather_batch, get_stock_price
 from .nps_metrics import get_nps_score, get_deep_detraction_rate
-from .churn_metrics import get_churn_rate, get_churn_reasons
+from .churn_metrics import get_churn_rate, get_churn_reasons, get_all_churn_rates, get_all_churn_reasons
 from .chart_generator import generate_chart_data, create_custom_dataset
 from .data_samples import (
     get_sample_sales_data,
@@ -23,11 +23,14 @@ from .data_samples import (
 
 __all__ = [
     "get_weather",
+    "get_weather_batch",
     "get_stock_price", 
     "get_nps_score",
     "get_deep_detraction_rate",
     "get_churn_rate",
     "get_churn_reasons",
+    "get_all_churn_rates",
+    "get_all_churn_reasons",
     "generate_chart_data",
     "create_custom_dataset",
     "get_sample_sales_data",
@@ -0,0 +1,24 @@
+"""
+Shared helpers for the tool modules.
+"""
+
+import time
+from functools import lru_cache
+from typing import Tuple
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with second precision, e.g. 2024-05-01T12:00:00Z."""
+    return _format_utc_second(int(time.time()))[0]
+
+
+def utc_now_formatted() -> Tuple[str, str]:
+    """Return the current UTC time as an (ISO 8601, "dd/mm/YYYY, HH:MM:SS") pair read from one clock sample."""
+    return _format_utc_second(int(time.time()))
+
+
+@lru_cache(maxsize=4)
+def _format_utc_second(sec: int) -> Tuple[str, str]:
+    """Format a Unix second both ways; memoized since calls cluster within the same second."""
+    t = time.gmtime(sec)
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", t), time.strftime("%d/%m/%Y, %H:%M:%S", t)
@@ -3,10 +3,60 @@ Dynamic chart generation tools for any aggregated dataset.
 Supports automatic data structure inference and multiple chart types.
 """
 
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Union
+from collections import defaultdict
+from copy import deepcopy
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
 from langchain_core.tools import tool
-import json
+import orjson
+import re
+import threading
+from ._util import utc_now_iso
+
+# Plain numbers, percentages ("12.5%") and currency amounts ("$1,200", "-$5") in one pass;
+# the sign may come before or after the currency symbol, but not both. Thousands
+# separators must form whole groups, so "1,2" (a decimal comma or a list) stays text
+_NUMERIC_RE = re.compile(
+    r"^\s*([-+])?\s*([$€£¥])?\s*"
+    r"([-+]?(?:(?:\d{1,3}(?:,\d{3})+|\d+(?:_\d+)*)(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"\s*(%)?\s*$"
+)
+
+# Recognized date shapes, one named group per strptime format; matches are then
+# validated with strptime, and slash dates switch to day-first when needed
+_DATE_RE = re.compile(
+    r"(?P<iso_datetime>\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2})"
+    r"|(?P<sql_datetime>\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2})"
+    r"|(?P<iso_date>\d{4}-\d{1,2}-\d{1,2})"
+    r"|(?P<year_month>\d{4}-\d{1,2})"
+    r"|(?P<slash_date>\d{1,2}/\d{1,2}/\d{4})"
+)
+_DATE_FORMATS = {
+    "iso_datetime": "%Y-%m-%dT%H:%M:%S",
+    "sql_datetime": "%Y-%m-%d %H:%M:%S",
+    "iso_date": "%Y-%m-%d",
+    "year_month": "%Y-%m",
+    "slash_date": "%m/%d/%Y"
+}
+
+# Memoized field analyses keyed by column contents. Small columns aren't worth caching
+# and large ones would make the keys too big. The sync tools run in worker threads,
+# so eviction and insertion take the lock
+_FIELD_CACHE: Dict[Tuple[Tuple[Any, ...], Tuple[type, ...]], Dict[str, Any]] = {}
+_FIELD_CACHE_MAXSIZE = 256
+_FIELD_CACHE_MIN_VALUES = 5
+_FIELD_CACHE_MAX_VALUES = 500
+_FIELD_CACHE_LOCK = threading.Lock()
+
+# Memoized whole-dataset analyses keyed by the raw JSON string. Only small payloads are
+# kept, so the cache holds at most a few MB however large the inputs get
+_ANALYSIS_CACHE: Dict[str, Dict[str, Any]] = {}
+_ANALYSIS_CACHE_MAXSIZE = 256
+_ANALYSIS_CACHE_MAX_CHARS = 16_384
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Pie tooltip formatter, evaluated by the frontend
+_PIE_TOOLTIP_LABEL = "function(context) { return context.label + ': ' + context.parsed + '%'; }"
 
 
 @tool
@@ -16,7 +66,8 @@ def generate_chart_data(
     x_field: Optional[str] = None,
     y_field: Optional[str] = None,
     title: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    fast_path: bool = True
 ):
     """Generate chart data from any aggregated dataset with automatic structure inference.
     
@@ -34,16 +85,22 @@ def generate_chart_data(
         y_field: Field name for Y-axis (auto-detected if not provided) 
         title: Chart title (auto-generated if not provided)
         description: Chart description (auto-generated if not provided)
+        fast_path: Skip data structure analysis when chart_type, x_field and y_field are all given
         
     Returns:
         Dictionary containing chart configuration and processed data
     """
     
-    # Parse input data if it's a JSON string
+    # A fully specified chart doesn't need any structure inference
+    skip_analysis = fast_path and chart_type != "auto" and bool(x_field) and bool(y_field)
+    raw = None
+    
+    # Parse input data if it's a JSON string; the rows are always freshly decoded
     if isinstance(data, str):
+        raw = data
         try:
-            data = json.loads(data)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return {"error": "Invalid JSON data provided"}
     
     if not data:
@@ -56,8 +113,27 @@ def generate_chart_data(
     if not isinstance(data, list):
         return {"error": "Data must be a list of objects or a single object"}
     
-    # Analyze data structure
-    analysis = _analyze_data_structure(data)
+    # Analyze data structure (dict/list inputs are unhashable and skip the cache)
+    if skip_analysis:
+        analysis = {
+            "total_records": len(data),
+            "fields": list(data[0].keys()) if isinstance(data[0], dict) else [],
+            "data_patterns": []
+        }
+        # Titles and descriptions still call out time series and categorical breakdowns,
+        # so classify the two plotted columns (and only those)
+        x_values = _column_values(data, x_field)
+        y_values = _column_values(data, y_field)
+        x_info = _analyze_field(x_field, x_values) if x_values else {}
+        y_info = _analyze_field(y_field, y_values) if y_values else {}
+        if x_info.get("type") in ("date", "datetime") or y_info.get("type") in ("date", "datetime"):
+            analysis["data_patterns"].append("time_series")
+        if x_info.get("type") == "categorical" and y_info.get("is_percentage"):
+            analysis["data_patterns"].append("categorical_breakdown")
+    elif raw is not None:
+        analysis = _analyze_json(raw, data)
+    else:
+        analysis = _analyze_data_structure(data)
     
     # Auto-detect chart type if not specified
     if chart_type == "auto":
@@ -86,11 +162,52 @@ def generate_chart_data(
         "description": description,
         "config": chart_config,
         "data_analysis": analysis,
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": utc_now_iso(),
         "total_data_points": len(data)
     }
 
 
+def _analyze_json(raw: str, data: List[Any]) -> Dict[str, Any]:
+    """Analyze the records already decoded from a JSON string, memoized on the raw string.
+    
+    Large strings skip the memo. The returned analysis always belongs to the caller.
+    """
+    
+    if len(raw) > _ANALYSIS_CACHE_MAX_CHARS:
+        return _analyze_data_structure(data)
+    cached = _ANALYSIS_CACHE.get(raw)
+    if cached is not None:
+        return deepcopy(cached)
+    
+    analysis = _analyze_data_structure(data)
+    # sample_values still point into this response's rows, so store a detached copy
+    stored = deepcopy(analysis)
+    with _ANALYSIS_CACHE_LOCK:
+        if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAXSIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE), None), None)
+        _ANALYSIS_CACHE[raw] = stored
+    return analysis
+
+
+def _collect_columns(rows: List[Any], include_none: bool = False) -> Dict[str, List[Any]]:
+    """Transpose a list of records into per-field value lists in a single pass."""
+    
+    columns = defaultdict(list)
+    for row in rows:
+        if isinstance(row, dict):
+            for key, value in row.items():
+                if include_none or value is not None:
+                    columns[key].append(value)
+    return columns
+
+
+def _column_values(rows: List[Any], field: str) -> List[Any]:
+    """Collect one field's non-null values from a list of records."""
+    
+    return [row[field] for row in rows if isinstance(row, dict) and row.get(field) is not None]
+
+
 def _analyze_data_structure(data: List[Dict]) -> Dict[str, Any]:
     """Analyze the structure of the input data to suggest optimal chart configuration."""
     
@@ -112,9 +229,11 @@ def _analyze_data_structure(data: List[Dict]) -> Dict[str, Any]:
         "data_patterns": []
     }
     
+    columns = _collect_columns(data)
+    
     # Analyze each field
     for field in fields:
-        values = [item.get(field) for item in data if item.get(field) is not None]
+        values = columns.get(field)
         if not values:
             continue
             
@@ -144,19 +263,80 @@ def _analyze_data_structure(data: List[Dict]) -> Dict[str, Any]:
         analysis["data_patterns"].append("time_series")
     if analysis["has_categories"] and analysis["has_percentages"]:
         analysis["data_patterns"].append("categorical_breakdown")
-    if len([f for f in analysis["field_types"] if analysis["field_types"][f]["type"] == "numeric"]) > 2:
+    if sum(1 for ft in analysis["field_types"].values() if ft["type"] == "numeric") > 2:
         analysis["data_patterns"].append("multi_metric")
     
     return analysis
 
 
+def _unique_count(values: List[Any]) -> int:
+    """Count distinct values, only stringifying them when some are unhashable."""
+    
+    try:
+        return len(set(values))
+    except TypeError:
+        return len({str(v) for v in values})
+
+
 def _analyze_field(field_name: str, values: List[Any]) -> Dict[str, Any]:
-    """Analyze a specific field to determine its type and characteristics."""
+    """Analyze a specific field to determine its type and characteristics.
+    
+    Results are memoized on the exact column contents, so charting the same
+    dataset again skips the classification work.
+    """
+    
+    if not _FIELD_CACHE_MIN_VALUES <= len(values) <= _FIELD_CACHE_MAX_VALUES:
+        return _classify_field(values)
+    try:
+        # Value types are part of the key because 1 == 1.0 == True
+        key = (tuple(values), tuple(type(v) for v in values))
+        cached = _FIELD_CACHE.get(key)
+    except TypeError:  # unhashable values such as nested dicts
+        return _classify_field(values)
+    
+    if cached is None:
+        cached = _classify_field(values)
+        with _FIELD_CACHE_LOCK:
+            if len(_FIELD_CACHE) >= _FIELD_CACHE_MAXSIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                _FIELD_CACHE.pop(next(iter(_FIELD_CACHE), None), None)
+            _FIELD_CACHE[key] = cached
+    # Nested lists (range, sample_values, date_formats) must not be shared either
+    return deepcopy(cached)
+
+
+def _parse_numeric(text: str) -> Optional[Tuple[float, bool, bool]]:
+    """Parse a numeric string into (value, is_percentage, is_currency), or None if it isn't one.
+    
+    >>> _parse_numeric("12.5%")
+    (12.5, True, False)
+    >>> _parse_numeric("-$1,200.50")
+    (-1200.5, False, True)
+    >>> _parse_numeric("$-5"), _parse_numeric("+1"), _parse_numeric("1_000")
+    ((-5.0, False, True), (1.0, False, False), (1000.0, False, False))
+    >>> _parse_numeric("€ 3e2")
+    (300.0, False, True)
+    >>> [_parse_numeric(s) for s in ("1,2", "1,", "1,,,2", "1,00", "--5", "-$-5", "1__0", "$", "")]
+    [None, None, None, None, None, None, None, None, None]
+    """
+    
+    match = _NUMERIC_RE.match(text)
+    if match is None:
+        return None
+    sign, currency, number, percent = match.groups()
+    if sign and number[0] in "+-":
+        return None
+    value = float(number.replace(',', '').replace('_', ''))
+    return (-value if sign == "-" else value), bool(percent), bool(currency)
+
+
+def _classify_field(values: List[Any]) -> Dict[str, Any]:
+    """Determine the type and characteristics of a column of values."""
     
     field_analysis = {
         "type": "unknown",
         "sample_values": values[:5],
-        "unique_count": len(set(str(v) for v in values)),
+        "unique_count": _unique_count(values),
         "is_percentage": False,
         "is_currency": False,
         "date_formats": []
@@ -165,49 +345,51 @@ def _analyze_field(field_name: str, values: List[Any]) -> Dict[str, Any]:
     # Check for numeric values
     numeric_values = []
     for val in values:
-        try:
-            if isinstance(val, (int, float)):
-                numeric_values.append(float(val))
-            elif isinstance(val, str):
-                # Try to parse percentage
-                if '%' in val:
-                    numeric_values.append(float(val.replace('%', '')))
+        if isinstance(val, (int, float)):
+            numeric_values.append(float(val))
+        elif isinstance(val, str):
+            parsed = _parse_numeric(val)
+            if parsed is not None:
+                number, is_percentage, is_currency = parsed
+                numeric_values.append(number)
+                if is_percentage:
                     field_analysis["is_percentage"] = True
-                # Try to parse currency
-                elif any(symbol in val for symbol in ['$', '€', '£', '¥']):
-                    clean_val = ''.join(c for c in val if c.isdigit() or c == '.')
-                    if clean_val:
-                        numeric_values.append(float(clean_val))
-                        field_analysis["is_currency"] = True
-                else:
-                    numeric_values.append(float(val))
-        except (ValueError, TypeError):
-            pass
+                elif is_currency:
+                    field_analysis["is_currency"] = True
     
     if len(numeric_values) > len(values) * 0.8:  # 80% are numeric
         field_analysis["type"] = "numeric"
         field_analysis["range"] = [min(numeric_values), max(numeric_values)]
         field_analysis["average"] = sum(numeric_values) / len(numeric_values)
     
-    # Check for date/time patterns
-    date_patterns = [
-        "%Y-%m-%d", "%Y-%m", "%m/%d/%Y", "%d/%m/%Y",
-        "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"
-    ]
-    
-    for pattern in date_patterns:
-        try:
-            parsed_dates = []
-            for val in values[:10]:  # Test first 10 values
-                if isinstance(val, str):
+    # Check for date/time patterns: the first 10 string values must share one shape
+    sample = values[:10]
+    shapes = set()
+    matched = 0
+    for val in sample:
+        if isinstance(val, str):
+            match = _DATE_RE.fullmatch(val)
+            if match is None:
+                break
+            shapes.add(match.lastgroup)
+            matched += 1
+    else:
+        if len(shapes) == 1 and matched > len(sample) * 0.8:
+            shape = shapes.pop()
+            pattern = _DATE_FORMATS[shape]
+            dates = [val for val in sample if isinstance(val, str)]
+            # A leading component above 12 can only be a day
+            if shape == "slash_date" and any(int(val.split("/", 1)[0]) > 12 for val in dates):
+                pattern = "%d/%m/%Y"
+            # The shape regex accepts impossible dates such as 2024-13-45
+            try:
+                for val in dates:
                     datetime.strptime(val, pattern)
-                    parsed_dates.append(val)
-            if len(parsed_dates) > len(values[:10]) * 0.8:
-                field_analysis["type"] = "date" if "T" not in pattern and ":" not in pattern else "datetime"
+            except ValueError:
+                pass
+            else:
+                field_analysis["type"] = "datetime" if ":" in pattern else "date"
                 field_analysis["date_formats"].append(pattern)
-                break
-        except ValueError:
-            continue
     
     # Check for categorical data
     if field_analysis["type"] == "unknown":
@@ -243,7 +425,10 @@ def _generate_chart_config(
     y_field: Optional[str],
     analysis: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Generate chart configuration based on data and chart type."""
+    """Generate chart configuration based on data and chart type.
+    
+    The option dicts are built per call so every response owns its config.
+    """
     
     config = {
         "type": chart_type,
@@ -277,7 +462,7 @@ def _generate_chart_config(
             "responsive": True,
             "plugins": {
                 "legend": {"position": "right"},
-                "tooltip": {"callbacks": {"label": "function(context) { return context.label + ': ' + context.parsed + '%'; }"}}
+                "tooltip": {"callbacks": {"label": _PIE_TOOLTIP_LABEL}}
             }
         }
     
@@ -287,9 +472,9 @@ def _generate_chart_config(
 def _generate_title(chart_config: Dict[str, Any], analysis: Dict[str, Any]) -> str:
     """Auto-generate a chart title based on the data analysis."""
     
-    chart_type = chart_config.get("type", "Chart")
-    x_field = chart_config.get("x_field", "")
-    y_field = chart_config.get("y_field", "")
+    chart_type = chart_config.get("type") or "Chart"
+    x_field = chart_config.get("x_field") or ""
+    y_field = chart_config.get("y_field") or ""
     
     if chart_type == "line" and "time_series" in analysis.get("data_patterns", []):
         return f"{y_field.replace('_', ' ').title()} Over Time"
@@ -346,10 +531,8 @@ def create_custom_dataset(
     if not all(isinstance(point, dict) for point in data_points):
         return {"error": "All data points must be dictionaries"}
     
-    # Get field information
-    all_fields = set()
-    for point in data_points:
-        all_fields.update(point.keys())
+    # Get field information and each field's values in a single pass
+    columns = _collect_columns(data_points, include_none=True)
     
     dataset = {
         "name": dataset_name,
@@ -357,17 +540,15 @@ def create_custom_dataset(
         "data": data_points,
         "metadata": {
             "total_records": len(data_points),
-            "fields": list(all_fields),
-            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "fields": list(columns),
+            "created_at": utc_now_iso(),
             "data_types": {}
         }
     }
     
     # Analyze field types
-    for field in all_fields:
-        values = [point.get(field) for point in data_points if field in point]
-        if values:
-            field_analysis = _analyze_field(field, values)
-            dataset["metadata"]["data_types"][field] = field_analysis["type"]
+    for field, values in columns.items():
+        field_analysis = _analyze_field(field, values)
+        dataset["metadata"]["data_types"][field] = field_analysis["type"]
     
     return dataset 
\ No newline at end of file
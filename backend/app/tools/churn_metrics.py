@@ -7,447 +7,354 @@ Supports churn rate metrics for UK, DE, and PT country codes:
 - Churn Reasons with detailed breakdown and insights
 """
 
-from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Sequence, Tuple
+import orjson
 from langchain_core.tools import tool
+from ._util import utc_now_formatted
+
+
+# Reporting months shared by every trend series
+_MONTHS = (
+    ("2024-01", "January 2024"),
+    ("2024-02", "February 2024"),
+    ("2024-03", "March 2024"),
+    ("2024-04", "April 2024"),
+    ("2024-05", "May 2024"),
+)
+
+
+def _trend(values: Sequence[float], key: str = "rate") -> Tuple[Dict[str, Any], ...]:
+    """Build a monthly trend series from one value per reporting month.
+
+    Series are tuples so the tables stay fixed after import; they serialize as JSON arrays.
+    """
+    return tuple({"date": date, key: value, "month_name": month_name} for (date, month_name), value in zip(_MONTHS, values))
+
+
+def _derive(
+    table: Dict[str, Dict[str, Any]],
+    derive: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Fill in each country's derived fields."""
+    return {code: derive(payload) for code, payload in table.items()}
+
+
+def _derive_rate_changes(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the trend_analysis change figures from the first and last trend points."""
+    first, last = payload["trend"][0]["rate"], payload["trend"][-1]["rate"]
+    # Derived figures go last so a stale value left in the literal can never win
+    payload["trend_analysis"] = {
+        **payload["trend_analysis"],
+        "change_absolute": round(last - first, 2),
+        "change_percentage": round((last - first) / first * 100, 1)
+    }
+    return payload
+
+
+def _mk_reason(total: int, row: Tuple[str, str, str, Sequence[float]]) -> Dict[str, Any]:
+    """Expand a (reason, severity, trend_direction, percentages) row into a reason entry.
+
+    The current percentage is the latest trend point and the count is that share of
+    the churned customers, rounded half up.
+    """
+    reason, severity, trend_direction, percentages = row
+    current = percentages[-1]
+    return {
+        "reason": reason,
+        "current_percentage": current,
+        "current_count": int(total * current / 100 + 0.5),
+        "severity": severity,
+        "trend_direction": trend_direction,
+        "historical_trend": _trend(percentages, "percentage")
+    }
+
+
+def _derive_reasons(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the full top_5_reasons entries from the compact reason rows."""
+    total = payload["total_churned_customers"]
+    payload["top_5_reasons"] = tuple(_mk_reason(total, row) for row in payload["top_5_reasons"])
+    return payload
+
+
+# This is a mock implementation
+_CHURN_RATE_DATA = _derive({
+    "UK": {
+        "company_name": "Vodafone UK", 
+        "churn_rate": 2.8,
+        "churn_rate_formatted": "2.8%",
+        "status": "improving",
+        "benchmark": {
+            "industry_average": 3.2,
+            "target": 2.5,
+            "status": "above_target"
+        },
+        "trend": _trend([3.5, 3.2, 3.0, 2.9, 2.8]),
+        "trend_analysis": {
+            "direction": "decreasing",
+            "description": "The churn rate has decreased from 3.5% to 2.8% over the period, showing strong customer retention improvement.",
+            "projection": "If the current trend continues, the rate may reach 2.6% by next month."
+        },
+        "insights": [
+            "Churn rate has improved by 0.7 percentage points over 5 months",
+            "Currently 0.4 points below industry average of 3.2%",
+            "Still 0.3 points above target of 2.5%",
+            "Strong customer retention momentum building"
+        ],
+        "period": {
+            "start_date": "2024-01",
+            "end_date": "2024-05",
+            "duration_months": 5
+        }
+    },
+    "DE": {
+        "company_name": "Vodafone Germany", 
+        "churn_rate": 4.2,
+        "churn_rate_formatted": "4.2%",
+        "status": "stable",
+        "benchmark": {
+            "industry_average": 4.1,
+            "target": 3.5,
+            "status": "above_target"
+        },
+        "trend": _trend([4.3, 4.1, 4.2, 4.3, 4.2]),
+        "trend_analysis": {
+            "direction": "stable",
+            "description": "The churn rate has remained relatively stable around 4.2% with minor fluctuations.",
+            "projection": "Rate expected to continue around 4.1-4.3% range in coming months."
+        },
+        "insights": [
+            "Churn rate has been relatively stable over 5 months",
+            "Slightly above industry average of 4.1%",
+            "0.7 points above target of 3.5%",
+            "Needs focused retention initiatives to improve"
+        ],
+        "period": {
+            "start_date": "2024-01",
+            "end_date": "2024-05",
+            "duration_months": 5
+        }
+    },
+    "PT": {
+        "company_name": "Vodafone Portugal", 
+        "churn_rate": 3.6,
+        "churn_rate_formatted": "3.6%",
+        "status": "declining",
+        "benchmark": {
+            "industry_average": 3.4,
+            "target": 3.0,
+            "status": "above_target"
+        },
+        "trend": _trend([3.1, 3.3, 3.4, 3.5, 3.6]),
+        "trend_analysis": {
+            "direction": "increasing",
+            "description": "The churn rate has increased from 3.1% to 3.6% over the period, indicating deteriorating customer retention.",
+            "projection": "If the current trend continues, the rate may reach 3.8% by next month."
+        },
+        "insights": [
+            "Churn rate has worsened by 0.5 percentage points over 5 months",
+            "Now above industry average of 3.4%",
+            "0.6 points above target of 3.0%",
+            "Urgent attention needed to reverse retention trend"
+        ],
+        "period": {
+            "start_date": "2024-01",
+            "end_date": "2024-05",
+            "duration_months": 5
+        }
+    },
+}, _derive_rate_changes)
+
+
+_CHURN_REASONS_DATA = _derive({
+    "UK": {
+        "company_name": "Vodafone UK",
+        "total_churned_customers": 12500,
+        "analysis_period": "May 2024",
+        "top_5_reasons": [
+            ("High pricing/Better competitor offers", "high", "increasing", [29.2, 30.8, 32.1, 33.4, 34.5]),
+            ("Poor network coverage/Quality issues", "high", "stable", [26.8, 26.1, 26.5, 26.0, 26.3]),
+            ("Customer service issues", "medium", "decreasing", [22.4, 21.8, 20.9, 20.2, 19.7]),
+            ("Billing/Contract disputes", "medium", "stable", [13.1, 12.6, 12.9, 13.2, 12.8]),
+            ("Relocation/Moving abroad", "low", "stable", [8.5, 8.7, 7.6, 7.2, 6.7])
+        ],
+        "insights": [
+            "Price sensitivity is the primary driver - consider competitive pricing strategies",
+            "Network quality issues affect 1 in 4 churned customers - infrastructure investment needed",
+            "Customer service improvements are showing positive results (decreasing trend)",
+            "Billing disputes remain consistent - process optimization opportunity"
+        ],
+        "recommendations": [
+            "Launch targeted retention campaigns for price-sensitive segments",
+            "Prioritize network coverage improvements in high-churn areas",
+            "Continue customer service training initiatives", 
+            "Implement proactive billing communication"
+        ],
+        "benchmarks": {
+            "industry_avg_price_sensitivity": 28.5,
+            "industry_avg_network_issues": 22.1,
+            "performance_vs_industry": "slightly worse on pricing, similar on network"
+        }
+    },
+    "DE": {
+        "company_name": "Vodafone Germany",
+        "total_churned_customers": 18750,
+        "analysis_period": "May 2024",
+        "top_5_reasons": [
+            ("Poor network coverage/Quality issues", "high", "increasing", [27.3, 28.1, 29.6, 30.4, 31.2]),
+            ("High pricing/Better competitor offers", "high", "stable", [28.9, 28.1, 28.7, 28.2, 28.4]),
+            ("Customer service issues", "medium", "increasing", [18.5, 19.2, 20.1, 20.8, 21.6]),
+            ("Limited data allowances", "medium", "stable", [13.2, 12.8, 12.1, 12.7, 12.4]),
+            ("Billing/Contract disputes", "low", "decreasing", [12.1, 11.8, 9.5, 7.9, 6.4])
+        ],
+        "insights": [
+            "Network quality is the biggest concern - significant infrastructure gaps",
+            "Strong competition on pricing from local operators",
+            "Customer service satisfaction declining - resource constraint issue",
+            "Data plan limitations becoming more important to customers"
+        ],
+        "recommendations": [
+            "Urgent network infrastructure investment program",
+            "Review and optimize data plan offerings",
+            "Expand customer service team and improve training",
+            "Competitive pricing analysis and adjustment"
+        ],
+        "benchmarks": {
+            "industry_avg_price_sensitivity": 28.5,
+            "industry_avg_network_issues": 22.1,
+            "performance_vs_industry": "worse on network quality, competitive on pricing"
+        }
+    },
+    "PT": {
+        "company_name": "Vodafone Portugal",
+        "total_churned_customers": 8900,
+        "analysis_period": "May 2024",
+        "top_5_reasons": [
+            ("High pricing/Better competitor offers", "high", "increasing", [32.1, 33.7, 35.4, 36.9, 37.8]),
+            ("Customer service issues", "high", "increasing", [19.8, 21.2, 22.7, 23.6, 24.3]),
+            ("Limited data allowances", "medium", "stable", [17.9, 18.5, 17.8, 18.4, 18.2]),
+            ("Poor network coverage/Quality issues", "medium", "decreasing", [16.4, 15.1, 14.2, 13.6, 12.9]),
+            ("Billing/Contract disputes", "low", "stable", [13.8, 11.5, 9.9, 7.5, 6.8])
+        ],
+        "insights": [
+            "Price competition is most intense - aggressive competitor pricing",
+            "Customer service quality declining significantly - major concern",
+            "Data plans not competitive with market offerings",
+            "Network quality better than other markets but still room for improvement"
+        ],
+        "recommendations": [
+            "Immediate pricing strategy review and competitive response",
+            "Customer service recovery program - quality and responsiveness focus",
+            "Launch new data plan packages to match market demand",
+            "Maintain network quality advantage through continued investment"
+        ],
+        "benchmarks": {
+            "industry_avg_price_sensitivity": 28.5,
+            "industry_avg_network_issues": 22.1,
+            "performance_vs_industry": "significantly worse on pricing, better on network"
+        }
+    }
+}, _derive_reasons)
+
+# Plain numeric views of the trend series, built once for callers that do arithmetic on them
+_CHURN_RATE_ARRAYS = {
+    code: {"trend_rates": tuple(point["rate"] for point in data["trend"])}
+    for code, data in _CHURN_RATE_DATA.items()
+}
+_CHURN_REASON_ARRAYS = {
+    code: {
+        "reason_percentages": {
+            reason["reason"]: tuple(point["percentage"] for point in reason["historical_trend"])
+            for reason in data["top_5_reasons"]
+        }
+    }
+    for code, data in _CHURN_REASONS_DATA.items()
+}
+
+# Responses pre-serialized once at import. Decoding a blob with orjson is cheaper than
+# copying the nested payload, and every caller gets objects nobody else holds
+_CHURN_RATE_JSON = {code: orjson.dumps(data) for code, data in _CHURN_RATE_DATA.items()}
+_CHURN_RATE_JSON_WITH_ARRAYS = {
+    code: orjson.dumps({**data, **_CHURN_RATE_ARRAYS[code]}) for code, data in _CHURN_RATE_DATA.items()
+}
+_CHURN_REASONS_JSON = {code: orjson.dumps(data) for code, data in _CHURN_REASONS_DATA.items()}
+_CHURN_REASONS_JSON_WITH_ARRAYS = {
+    code: orjson.dumps({**data, **_CHURN_REASON_ARRAYS[code]}) for code, data in _CHURN_REASONS_DATA.items()
+}
+_ALL_CHURN_RATES_JSON = orjson.dumps({"countries": _CHURN_RATE_DATA})
+_ALL_CHURN_REASONS_JSON = orjson.dumps({"countries": _CHURN_REASONS_DATA})
+
+# Listed in not-found errors; both tables cover the same countries
+_SUPPORTED_CODES = ", ".join(_CHURN_RATE_DATA)
+
+
+def _serve(table: Dict[str, bytes], country_code: str, kind: str) -> Dict[str, Any]:
+    """Return a freshly decoded, timestamped copy of a country's payload, or the not-found error for that metric."""
+    # LLMs usually send upper-case codes already, so try those before allocating an upper-cased copy
+    blob = table.get(country_code) or table.get(country_code.upper())
+    if blob is None:
+        return {"error": f"{kind} for Vodafone in {country_code} not found. Supported country codes are {_SUPPORTED_CODES}."}
+
+    return _decode(blob)
+
+
+def _decode(blob: bytes) -> Dict[str, Any]:
+    """Decode a pre-serialized response and stamp it with the current time."""
+    response_data = orjson.loads(blob)
+    response_data["timestamp"], response_data["last_updated_formatted"] = utc_now_formatted()
+    return response_data
 
 
 @tool
-def get_churn_rate(country_code: str):
+async def get_churn_rate(country_code: str, include_arrays: bool = False) -> Dict[str, Any]:
     """Get the Churn Rate for Vodafone in a given country, including a historical trend. 
     
     This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
     
     Args:
         country_code: Country code (UK, DE, PT)
+        include_arrays: Also return the trend as a plain list of rates under "trend_rates"
         
     Returns:
         Dictionary containing churn rate data with historical trends or error message
     """
-    # This is a mock implementation
-    mock_churn_data = {
-        "UK": {
-            "company_name": "Vodafone UK", 
-            "churn_rate": 2.8,
-            "churn_rate_formatted": "2.8%",
-            "status": "improving",
-            "benchmark": {
-                "industry_average": 3.2,
-                "target": 2.5,
-                "status": "above_target"
-            },
-            "trend": [
-                {"date": "2024-01", "rate": 3.5, "month_name": "January 2024"},
-                {"date": "2024-02", "rate": 3.2, "month_name": "February 2024"},
-                {"date": "2024-03", "rate": 3.0, "month_name": "March 2024"},
-                {"date": "2024-04", "rate": 2.9, "month_name": "April 2024"},
-                {"date": "2024-05", "rate": 2.8, "month_name": "May 2024"},
-            ],
-            "trend_analysis": {
-                "direction": "decreasing",
-                "change_absolute": -0.7,
-                "change_percentage": -20.0,
-                "description": "The churn rate has decreased from 3.5% to 2.8% over the period, showing strong customer retention improvement.",
-                "projection": "If the current trend continues, the rate may reach 2.6% by next month."
-            },
-            "insights": [
-                "Churn rate has improved by 0.7 percentage points over 5 months",
-                "Currently 0.4 points below industry average of 3.2%",
-                "Still 0.3 points above target of 2.5%",
-                "Strong customer retention momentum building"
-            ],
-            "period": {
-                "start_date": "2024-01",
-                "end_date": "2024-05",
-                "duration_months": 5
-            }
-        },
-        "DE": {
-            "company_name": "Vodafone Germany", 
-            "churn_rate": 4.2,
-            "churn_rate_formatted": "4.2%",
-            "status": "stable",
-            "benchmark": {
-                "industry_average": 4.1,
-                "target": 3.5,
-                "status": "above_target"
-            },
-            "trend": [
-                {"date": "2024-01", "rate": 4.3, "month_name": "January 2024"},
-                {"date": "2024-02", "rate": 4.1, "month_name": "February 2024"},
-                {"date": "2024-03", "rate": 4.2, "month_name": "March 2024"},
-                {"date": "2024-04", "rate": 4.3, "month_name": "April 2024"},
-                {"date": "2024-05", "rate": 4.2, "month_name": "May 2024"},
-            ],
-            "trend_analysis": {
-                "direction": "stable",
-                "change_absolute": -0.1,
-                "change_percentage": -2.3,
-                "description": "The churn rate has remained relatively stable around 4.2% with minor fluctuations.",
-                "projection": "Rate expected to continue around 4.1-4.3% range in coming months."
-            },
-            "insights": [
-                "Churn rate has been relatively stable over 5 months",
-                "Slightly above industry average of 4.1%",
-                "0.7 points above target of 3.5%",
-                "Needs focused retention initiatives to improve"
-            ],
-            "period": {
-                "start_date": "2024-01",
-                "end_date": "2024-05",
-                "duration_months": 5
-            }
-        },
-        "PT": {
-            "company_name": "Vodafone Portugal", 
-            "churn_rate": 3.6,
-            "churn_rate_formatted": "3.6%",
-            "status": "declining",
-            "benchmark": {
-                "industry_average": 3.4,
-                "target": 3.0,
-                "status": "above_target"
-            },
-            "trend": [
-                {"date": "2024-01", "rate": 3.1, "month_name": "January 2024"},
-                {"date": "2024-02", "rate": 3.3, "month_name": "February 2024"},
-                {"date": "2024-03", "rate": 3.4, "month_name": "March 2024"},
-                {"date": "2024-04", "rate": 3.5, "month_name": "April 2024"},
-                {"date": "2024-05", "rate": 3.6, "month_name": "May 2024"},
-            ],
-            "trend_analysis": {
-                "direction": "increasing",
-                "change_absolute": 0.5,
-                "change_percentage": 16.1,
-                "description": "The churn rate has increased from 3.1% to 3.6% over the period, indicating deteriorating customer retention.",
-                "projection": "If the current trend continues, the rate may reach 3.8% by next month."
-            },
-            "insights": [
-                "Churn rate has worsened by 0.5 percentage points over 5 months",
-                "Now above industry average of 3.4%",
-                "0.6 points above target of 3.0%",
-                "Urgent attention needed to reverse retention trend"
-            ],
-            "period": {
-                "start_date": "2024-01",
-                "end_date": "2024-05",
-                "duration_months": 5
-            }
-        },
-    }
-
-    code = country_code.upper()
-    if code in mock_churn_data:
-        response_data = mock_churn_data[code].copy()
-        response_data["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        response_data["last_updated_formatted"] = datetime.now(timezone.utc).strftime("%d/%m/%Y, %H:%M:%S")
-        return response_data
-        
-    return {"error": f"Churn Rate for Vodafone in {country_code} not found. Supported country codes are UK, DE, PT."}
+    return _serve(_CHURN_RATE_JSON_WITH_ARRAYS if include_arrays else _CHURN_RATE_JSON, country_code, "Churn Rate")
 
 
 @tool
-def get_churn_reasons(country_code: str):
+async def get_churn_reasons(country_code: str, include_arrays: bool = False) -> Dict[str, Any]:
     """Get the top 5 reasons for customer churn for Vodafone in a given country with percentage breakdown and historical trends.
     
     This is a mocked function and supports country codes 'UK', 'DE', and 'PT'.
     
     Args:
         country_code: Country code (UK, DE, PT)
+        include_arrays: Also return each reason's historical percentages as plain lists under "reason_percentages"
         
     Returns:
         Dictionary containing churn reasons data with percentage breakdown and trend analysis or error message
     """
-    # This is a mock implementation
-    mock_churn_reasons_data = {
-        "UK": {
-            "company_name": "Vodafone UK",
-            "total_churned_customers": 12500,
-            "analysis_period": "May 2024",
-            "top_5_reasons": [
-                {
-                    "reason": "High pricing/Better competitor offers",
-                    "current_percentage": 34.5,
-                    "current_count": 4313,
-                    "severity": "high",
-                    "trend_direction": "increasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 29.2, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 30.8, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 32.1, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 33.4, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 34.5, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Poor network coverage/Quality issues",
-                    "current_percentage": 26.3,
-                    "current_count": 3288,
-                    "severity": "high", 
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 26.8, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 26.1, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 26.5, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 26.0, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 26.3, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Customer service issues",
-                    "current_percentage": 19.7,
-                    "current_count": 2463,
-                    "severity": "medium",
-                    "trend_direction": "decreasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 22.4, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 21.8, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 20.9, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 20.2, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 19.7, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Billing/Contract disputes",
-                    "current_percentage": 12.8,
-                    "current_count": 1600,
-                    "severity": "medium",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 13.1, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 12.6, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 12.9, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 13.2, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 12.8, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Relocation/Moving abroad",
-                    "current_percentage": 6.7,
-                    "current_count": 838,
-                    "severity": "low",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 8.5, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 8.7, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 7.6, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 7.2, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 6.7, "month_name": "May 2024"}
-                    ]
-                }
-            ],
-            "insights": [
-                "Price sensitivity is the primary driver - consider competitive pricing strategies",
-                "Network quality issues affect 1 in 4 churned customers - infrastructure investment needed",
-                "Customer service improvements are showing positive results (decreasing trend)",
-                "Billing disputes remain consistent - process optimization opportunity"
-            ],
-            "recommendations": [
-                "Launch targeted retention campaigns for price-sensitive segments",
-                "Prioritize network coverage improvements in high-churn areas",
-                "Continue customer service training initiatives", 
-                "Implement proactive billing communication"
-            ],
-            "benchmarks": {
-                "industry_avg_price_sensitivity": 28.5,
-                "industry_avg_network_issues": 22.1,
-                "performance_vs_industry": "slightly worse on pricing, similar on network"
-            }
-        },
-        "DE": {
-            "company_name": "Vodafone Germany",
-            "total_churned_customers": 18750,
-            "analysis_period": "May 2024",
-            "top_5_reasons": [
-                {
-                    "reason": "Poor network coverage/Quality issues",
-                    "current_percentage": 31.2,
-                    "current_count": 5850,
-                    "severity": "high",
-                    "trend_direction": "increasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 27.3, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 28.1, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 29.6, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 30.4, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 31.2, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "High pricing/Better competitor offers",
-                    "current_percentage": 28.4,
-                    "current_count": 5325,
-                    "severity": "high",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 28.9, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 28.1, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 28.7, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 28.2, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 28.4, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Customer service issues",
-                    "current_percentage": 21.6,
-                    "current_count": 4050,
-                    "severity": "medium",
-                    "trend_direction": "increasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 18.5, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 19.2, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 20.1, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 20.8, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 21.6, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Limited data allowances",
-                    "current_percentage": 12.4,
-                    "current_count": 2325,
-                    "severity": "medium",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 13.2, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 12.8, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 12.1, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 12.7, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 12.4, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Billing/Contract disputes",
-                    "current_percentage": 6.4,
-                    "current_count": 1200,
-                    "severity": "low",
-                    "trend_direction": "decreasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 12.1, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 11.8, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 9.5, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 7.9, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 6.4, "month_name": "May 2024"}
-                    ]
-                }
-            ],
-            "insights": [
-                "Network quality is the biggest concern - significant infrastructure gaps",
-                "Strong competition on pricing from local operators",
-                "Customer service satisfaction declining - resource constraint issue",
-                "Data plan limitations becoming more important to customers"
-            ],
-            "recommendations": [
-                "Urgent network infrastructure investment program",
-                "Review and optimize data plan offerings",
-                "Expand customer service team and improve training",
-                "Competitive pricing analysis and adjustment"
-            ],
-            "benchmarks": {
-                "industry_avg_price_sensitivity": 28.5,
-                "industry_avg_network_issues": 22.1,
-                "performance_vs_industry": "worse on network quality, competitive on pricing"
-            }
-        },
-        "PT": {
-            "company_name": "Vodafone Portugal",
-            "total_churned_customers": 8900,
-            "analysis_period": "May 2024",
-            "top_5_reasons": [
-                {
-                    "reason": "High pricing/Better competitor offers",
-                    "current_percentage": 37.8,
-                    "current_count": 3364,
-                    "severity": "high",
-                    "trend_direction": "increasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 32.1, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 33.7, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 35.4, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 36.9, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 37.8, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Customer service issues",
-                    "current_percentage": 24.3,
-                    "current_count": 2163,
-                    "severity": "high",
-                    "trend_direction": "increasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 19.8, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 21.2, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 22.7, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 23.6, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 24.3, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Limited data allowances",
-                    "current_percentage": 18.2,
-                    "current_count": 1620,
-                    "severity": "medium",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 17.9, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 18.5, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 17.8, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 18.4, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 18.2, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Poor network coverage/Quality issues",
-                    "current_percentage": 12.9,
-                    "current_count": 1148,
-                    "severity": "medium",
-                    "trend_direction": "decreasing",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 16.4, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 15.1, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 14.2, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 13.6, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 12.9, "month_name": "May 2024"}
-                    ]
-                },
-                {
-                    "reason": "Billing/Contract disputes",
-                    "current_percentage": 6.8,
-                    "current_count": 605,
-                    "severity": "low",
-                    "trend_direction": "stable",
-                    "historical_trend": [
-                        {"date": "2024-01", "percentage": 13.8, "month_name": "January 2024"},
-                        {"date": "2024-02", "percentage": 11.5, "month_name": "February 2024"},
-                        {"date": "2024-03", "percentage": 9.9, "month_name": "March 2024"},
-                        {"date": "2024-04", "percentage": 7.5, "month_name": "April 2024"},
-                        {"date": "2024-05", "percentage": 6.8, "month_name": "May 2024"}
-                    ]
-                }
-            ],
-            "insights": [
-                "Price competition is most intense - aggressive competitor pricing",
-                "Customer service quality declining significantly - major concern",
-                "Data plans not competitive with market offerings",
-                "Network quality better than other markets but still room for improvement"
-            ],
-            "recommendations": [
-                "Immediate pricing strategy review and competitive response",
-                "Customer service recovery program - quality and responsiveness focus",
-                "Launch new data plan packages to match market demand",
-                "Maintain network quality advantage through continued investment"
-            ],
-            "benchmarks": {
-                "industry_avg_price_sensitivity": 28.5,
-                "industry_avg_network_issues": 22.1,
-                "performance_vs_industry": "significantly worse on pricing, better on network"
-            }
-        }
-    }
+    return _serve(_CHURN_REASONS_JSON_WITH_ARRAYS if include_arrays else _CHURN_REASONS_JSON, country_code, "Churn reasons")
 
-    code = country_code.upper()
-    if code in mock_churn_reasons_data:
-        response_data = mock_churn_reasons_data[code].copy()
-        response_data["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        response_data["last_updated_formatted"] = datetime.now(timezone.utc).strftime("%d/%m/%Y, %H:%M:%S")
-        return response_data
-        
-    return {"error": f"Churn reasons for Vodafone in {country_code} not found. Supported country codes are UK, DE, PT."} 
\ No newline at end of file
+
+@tool
+async def get_all_churn_rates() -> Dict[str, Any]:
+    """Get the Churn Rate for Vodafone in every supported country (UK, DE, PT) in one call.
+    
+    Prefer this over calling get_churn_rate once per country when comparing markets.
+    
+    Returns:
+        Dictionary with a "countries" mapping of country code to churn rate data, plus a timestamp
+    """
+    return _decode(_ALL_CHURN_RATES_JSON)
+
+
+@tool
+async def get_all_churn_reasons() -> Dict[str, Any]:
+    """Get the top 5 churn reasons for Vodafone in every supported country (UK, DE, PT) in one call.
+    
+    Prefer this over calling get_churn_reasons once per country when comparing markets.
+    
+    Returns:
+        Dictionary with a "countries" mapping of country code to churn reasons data, plus a timestamp
+    """
+    return _decode(_ALL_CHURN_REASONS_JSON)
\ No newline at end of file
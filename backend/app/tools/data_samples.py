@@ -3,102 +3,174 @@ Sample data generation tools for testing chart functionality.
 Provides various types of sample datasets for demonstration purposes.
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Sequence, Tuple
 from langchain_core.tools import tool
+import math
 import random
+from ._util import utc_now_iso
+
+
+# Private generator so sample data never shares or reseeds the global random state
+_RNG = random.Random()
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Static market share breakdown; copied per response so callers cannot alter it
+_MARKET_SHARE = (
+    {"name": "Company A", "share": 35.2},
+    {"name": "Company B", "share": 28.7},
+    {"name": "Company C", "share": 18.4},
+    {"name": "Company D", "share": 12.1},
+    {"name": "Others", "share": 5.6}
+)
+_MARKET_SHARE_TOTAL = sum(company["share"] for company in _MARKET_SHARE)
+
+# Scatter point labels, extended on demand and reused by later calls
+_POINT_IDS: List[str] = []
+_POINT_IDS_MAX = 1000
+
+
+def _finalize(
+    dataset_name: str,
+    description: str,
+    data: Sequence[Dict[str, Any]],
+    metadata: Dict[str, Any],
+    suggested_charts: List[str]
+) -> Dict[str, Any]:
+    """Wrap generated records in the response shape shared by the sample data tools."""
+    return {
+        "dataset_name": dataset_name,
+        "description": description,
+        "data": data,
+        "metadata": {"total_records": len(data), **metadata},
+        "suggested_charts": suggested_charts,
+        "timestamp": utc_now_iso()
+    }
+
+
+def _sales_values(months: int, base_sales: int) -> List[int]:
+    """Monthly sales figures with a growth trend, seasonal swing and random variation."""
+    # Local bindings skip the global and attribute lookups on every iteration
+    _sin, _uniform = math.sin, _RNG.uniform
+    return [
+        int(
+            base_sales
+            * (1 + 0.2 * _sin(i * 0.5))  # Seasonal variation
+            * (1 + i * 0.05)  # Growth trend
+            * (1 + _uniform(-0.15, 0.15))  # Random variation
+        )
+        for i in range(months)
+    ]
+
+
+def _scatter_points(records: int) -> List[Tuple[float, float]]:
+    """Positively correlated (x, y) pairs with noise, rounded to one decimal."""
+    _uniform = _RNG.uniform
+    points = []
+    for _ in range(records):
+        x = _uniform(10, 100)
+        y = 2 * x + _uniform(-20, 20) + _uniform(0, 30)  # Some correlation + noise
+        points.append((round(x, 1), round(y, 1)))
+    return points
+
+
+def _point_ids(count: int) -> List[str]:
+    """Labels Point_1..Point_<count>, formatting each cached label only once per process."""
+    cached = len(_POINT_IDS)
+    if count > cached and cached < _POINT_IDS_MAX:
+        _POINT_IDS.extend(f"Point_{i + 1}" for i in range(cached, min(count, _POINT_IDS_MAX)))
+        cached = len(_POINT_IDS)
+    point_ids = _POINT_IDS[:count]
+    if count > cached:
+        # Very large requests are formatted directly rather than growing the cache without bound
+        point_ids.extend(f"Point_{i + 1}" for i in range(cached, count))
+    return point_ids
 
 
 @tool
-def get_sample_sales_data(period_months: int = 6):
+async def get_sample_sales_data(period_months: int = 6, include_formatted: bool = False):
     """Generate sample sales data for chart testing.
     
     Args:
         period_months: Number of months of data to generate (default: 6)
+        include_formatted: Also return a display string for each sales figure (e.g. "$10,250")
         
     Returns:
         Dictionary containing sample sales data with monthly breakdown
     """
     
     base_date = datetime.now() - timedelta(days=30 * period_months)
+    # Count months from year 0 so each step is one integer increment
+    base_month = base_date.year * 12 + base_date.month - 1
     sales_data = []
     
-    base_sales = 10000
-    
-    for i in range(period_months):
-        current_date = base_date + timedelta(days=30 * i)
-        month_name = current_date.strftime("%B %Y")
-        month_code = current_date.strftime("%Y-%m")
-        
-        # Add some realistic variation
-        seasonal_factor = 1 + 0.2 * random.sin(i * 0.5)  # Seasonal variation
-        growth_factor = 1 + (i * 0.05)  # Growth trend
-        random_factor = 1 + random.uniform(-0.15, 0.15)  # Random variation
+    for i, sales in enumerate(_sales_values(period_months, 10000)):
+        year, month = divmod(base_month + i, 12)
+        month_name = f"{_MONTH_NAMES[month]} {year}"
+        month_code = f"{year:04d}-{month + 1:02d}"
         
-        sales = int(base_sales * seasonal_factor * growth_factor * random_factor)
-        
-        sales_data.append({
+        record = {
             "month": month_code,
             "month_name": month_name,
-            "sales": sales,
-            "sales_formatted": f"${sales:,}"
-        })
+            "sales": sales
+        }
+        if include_formatted:
+            record["sales_formatted"] = f"${sales:,}"
+        sales_data.append(record)
     
-    return {
-        "dataset_name": "Sample Sales Data",
-        "description": f"Monthly sales data over {period_months} months showing growth trend with seasonal variation",
-        "data": sales_data,
-        "metadata": {
-            "total_records": len(sales_data),
+    data_types = {
+        "month": "date",
+        "month_name": "text", 
+        "sales": "numeric"
+    }
+    if include_formatted:
+        data_types["sales_formatted"] = "text"
+    
+    return _finalize(
+        "Sample Sales Data",
+        f"Monthly sales data over {period_months} months showing growth trend with seasonal variation",
+        sales_data,
+        {
             "date_range": f"{sales_data[0]['month']} to {sales_data[-1]['month']}",
-            "data_types": {
-                "month": "date",
-                "month_name": "text", 
-                "sales": "numeric",
-                "sales_formatted": "text"
-            }
+            "data_types": data_types
         },
-        "suggested_charts": ["line", "bar"],
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    }
+        ["line", "bar"]
+    )
 
 
 @tool  
-def get_sample_market_share_data():
+async def get_sample_market_share_data():
     """Generate sample market share data for pie chart testing.
     
     Returns:
         Dictionary containing sample market share data for different companies
     """
-    
-    companies = [
-        {"name": "Company A", "share": 35.2},
-        {"name": "Company B", "share": 28.7},
-        {"name": "Company C", "share": 18.4},
-        {"name": "Company D", "share": 12.1},
-        {"name": "Others", "share": 5.6}
-    ]
-    
-    return {
-        "dataset_name": "Sample Market Share Data",
-        "description": "Market share distribution among top companies in the industry",
-        "data": companies,
-        "metadata": {
-            "total_records": len(companies),
-            "total_share": sum(c["share"] for c in companies),
+    return _finalize(
+        "Sample Market Share Data",
+        "Market share distribution among top companies in the industry",
+        [dict(company) for company in _MARKET_SHARE],
+        {
+            "total_share": _MARKET_SHARE_TOTAL,
             "data_types": {
                 "name": "categorical",
                 "share": "numeric"
             }
         },
-        "suggested_charts": ["pie", "bar"],
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    }
+        ["pie", "bar"]
+    )
 
 
 @tool
-def get_sample_performance_metrics():
+async def get_sample_performance_metrics(include_formatted: bool = False):
     """Generate sample performance metrics data for multi-metric analysis.
     
+    Args:
+        include_formatted: Also return a percentage display string for each metric (e.g. "87.5%")
+        
     Returns:
         Dictionary containing sample performance data with multiple metrics
     """
@@ -108,26 +180,27 @@ def get_sample_performance_metrics():
     
     for dept in departments:
         # Generate realistic but varied metrics
-        efficiency = random.uniform(75, 95)
-        satisfaction = random.uniform(80, 98)
-        productivity = random.uniform(70, 90)
+        efficiency = _RNG.uniform(75, 95)
+        satisfaction = _RNG.uniform(80, 98)
+        productivity = _RNG.uniform(70, 90)
         
-        metrics_data.append({
+        record = {
             "department": dept,
             "efficiency": round(efficiency, 1),
             "satisfaction": round(satisfaction, 1), 
-            "productivity": round(productivity, 1),
-            "efficiency_formatted": f"{efficiency:.1f}%",
-            "satisfaction_formatted": f"{satisfaction:.1f}%",
-            "productivity_formatted": f"{productivity:.1f}%"
-        })
+            "productivity": round(productivity, 1)
+        }
+        if include_formatted:
+            record["efficiency_formatted"] = f"{efficiency:.1f}%"
+            record["satisfaction_formatted"] = f"{satisfaction:.1f}%"
+            record["productivity_formatted"] = f"{productivity:.1f}%"
+        metrics_data.append(record)
     
-    return {
-        "dataset_name": "Sample Performance Metrics",
-        "description": "Department performance metrics including efficiency, satisfaction, and productivity scores",
-        "data": metrics_data,
-        "metadata": {
-            "total_records": len(metrics_data),
+    return _finalize(
+        "Sample Performance Metrics",
+        "Department performance metrics including efficiency, satisfaction, and productivity scores",
+        metrics_data,
+        {
             "metrics": ["efficiency", "satisfaction", "productivity"],
             "data_types": {
                 "department": "categorical",
@@ -136,13 +209,12 @@ def get_sample_performance_metrics():
                 "productivity": "numeric"
             }
         },
-        "suggested_charts": ["multi-bar", "scatter", "bar"],
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    }
+        ["multi-bar", "scatter", "bar"]
+    )
 
 
 @tool
-def get_sample_time_series_data(metric_name: str = "Revenue", days: int = 30):
+async def get_sample_time_series_data(metric_name: str = "Revenue", days: int = 30):
     """Generate sample time series data for line chart testing.
     
     Args:
@@ -153,37 +225,34 @@ def get_sample_time_series_data(metric_name: str = "Revenue", days: int = 30):
         Dictionary containing daily time series data
     """
     
-    base_date = datetime.now() - timedelta(days=days)
-    time_series_data = []
+    start = (datetime.now() - timedelta(days=days)).toordinal()
     
     base_value = 1000
-    trend = random.uniform(-0.5, 1.5)  # Random trend
+    trend = _RNG.uniform(-0.5, 1.5)  # Random trend
     
-    for i in range(days):
-        current_date = base_date + timedelta(days=i)
-        date_str = current_date.strftime("%Y-%m-%d")
-        date_formatted = current_date.strftime("%m/%d")
-        
-        # Generate realistic daily variation
-        trend_value = base_value + (i * trend)
-        seasonal_factor = 1 + 0.1 * random.sin(i * 0.2)
-        daily_noise = random.uniform(-50, 50)
-        
-        value = max(0, int(trend_value * seasonal_factor + daily_noise))
-        
-        time_series_data.append({
-            "date": date_str,
-            "date_formatted": date_formatted,
+    # Generate realistic daily variation: trend, seasonal swing and daily noise
+    _sin, _uniform = math.sin, _RNG.uniform
+    values = [
+        max(0, int((base_value + i * trend) * (1 + 0.1 * _sin(i * 0.2)) + _uniform(-50, 50)))
+        for i in range(days)
+    ]
+    dates = [date.fromordinal(start + i) for i in range(days)]
+    
+    time_series_data = [
+        {
+            "date": current_date.isoformat(),
+            "date_formatted": f"{current_date.month:02d}/{current_date.day:02d}",
             "value": value,
             "metric_name": metric_name
-        })
+        }
+        for current_date, value in zip(dates, values)
+    ]
     
-    return {
-        "dataset_name": f"Sample {metric_name} Time Series",
-        "description": f"Daily {metric_name.lower()} data over {days} days showing trend and variation",
-        "data": time_series_data,
-        "metadata": {
-            "total_records": len(time_series_data),
+    return _finalize(
+        f"Sample {metric_name} Time Series",
+        f"Daily {metric_name.lower()} data over {days} days showing trend and variation",
+        time_series_data,
+        {
             "date_range": f"{time_series_data[0]['date']} to {time_series_data[-1]['date']}",
             "metric": metric_name,
             "data_types": {
@@ -193,13 +262,12 @@ def get_sample_time_series_data(metric_name: str = "Revenue", days: int = 30):
                 "metric_name": "text"
             }
         },
-        "suggested_charts": ["line"],
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    }
+        ["line"]
+    )
 
 
 @tool
-def get_sample_scatter_data(records: int = 50):
+async def get_sample_scatter_data(records: int = 50):
     """Generate sample scatter plot data for correlation analysis.
     
     Args:
@@ -209,25 +277,20 @@ def get_sample_scatter_data(records: int = 50):
         Dictionary containing sample data for scatter plot
     """
     
-    scatter_data = []
-    
-    for i in range(records):
-        # Create some correlation between x and y with noise
-        x = random.uniform(10, 100)
-        y = 2 * x + random.uniform(-20, 20) + random.uniform(0, 30)  # Some correlation + noise
-        
-        scatter_data.append({
-            "x_value": round(x, 1),
-            "y_value": round(y, 1),
-            "point_id": f"Point_{i+1}"
-        })
+    scatter_data = [
+        {
+            "x_value": x,
+            "y_value": y,
+            "point_id": point_id
+        }
+        for point_id, (x, y) in zip(_point_ids(records), _scatter_points(records))
+    ]
     
-    return {
-        "dataset_name": "Sample Scatter Data",
-        "description": f"Sample scatter plot data with {records} points showing correlation between X and Y variables",
-        "data": scatter_data,
-        "metadata": {
-            "total_records": len(scatter_data),
+    return _finalize(
+        "Sample Scatter Data",
+        f"Sample scatter plot data with {records} points showing correlation between X and Y variables",
+        scatter_data,
+        {
             "correlation": "positive_moderate",
             "data_types": {
                 "x_value": "numeric",
@@ -235,6 +298,5 @@ def get_sample_scatter_data(records: int = 50):
                 "point_id": "text"
             }
         },
-        "suggested_charts": ["scatter"],
-        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    } 
\ No newline at end of file
+        ["scatter"]
+    ) 
\ No newline at end of file
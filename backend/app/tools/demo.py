@@ -6,15 +6,71 @@ This module contains demonstration tools:
 - Financial tools for stock price data (mocked)
 """
 
+import asyncio
+import logging
+import math
 import os
-import requests
-from datetime import datetime, timezone
-from typing import Dict, Any
+import time
+import httpx
+import orjson
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.tools import tool
+from ._util import utc_now_iso
 
+logger = logging.getLogger(__name__)
 
-def fetch_weather_data(location: str) -> Dict[str, Any]:
-    """Fetch weather data from WeatherAPI.com."""
+
+# Shared connection pool so repeated lookups reuse keep-alive connections
+httpx_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(10.0, connect=3.05),
+    transport=httpx.AsyncHTTPTransport(
+        retries=3,  # Reconnect on connection errors
+        limits=httpx.Limits(max_keepalive_connections=20)
+    )
+)
+
+# Transient WeatherAPI responses worth retrying, with exponential backoff between attempts
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.2  # seconds
+_ERROR_SNIPPET_LENGTH = 200
+
+# Most lookups get_weather_batch keeps in flight at once, so a long list can't flood WeatherAPI
+_BATCH_CONCURRENCY = 5
+
+# Recent WeatherAPI response bodies keyed by normalized location: (expires_at, body).
+# The raw JSON is kept so every caller decodes a dict of its own
+_WEATHER_CACHE: Dict[str, Tuple[float, bytes]] = {}
+_WEATHER_CACHE_TTL = 300.0  # seconds; conditions only change every few minutes. Override with WEATHER_CACHE_TTL
+_WEATHER_CACHE_MAXSIZE = 512
+
+
+@lru_cache(maxsize=1)
+def _parse_cache_ttl(raw: Optional[str]) -> float:
+    """Parse a WEATHER_CACHE_TTL value, falling back to the default when it is unusable."""
+    if raw is None:
+        return _WEATHER_CACHE_TTL
+    try:
+        ttl = float(raw)
+    except ValueError:
+        ttl = math.nan
+    if not math.isfinite(ttl) or ttl < 0:
+        logger.warning(
+            "Ignoring invalid WEATHER_CACHE_TTL=%r; using %s seconds", raw, _WEATHER_CACHE_TTL
+        )
+        return _WEATHER_CACHE_TTL
+    return ttl
+
+
+async def fetch_weather_data(location: str) -> Dict[str, Any]:
+    """Fetch weather data from WeatherAPI.com, reusing responses younger than the cache TTL."""
+    cache_key = location.strip().lower()
+    cached = _WEATHER_CACHE.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return orjson.loads(cached[1])
+    
     api_key = os.environ.get("WEATHERAPI_KEY")
     if not api_key:
         raise ValueError("WEATHERAPI_KEY environment variable is not set")
@@ -26,15 +82,76 @@ def fetch_weather_data(location: str) -> Dict[str, Any]:
         "aqi": "yes"  # Include air quality data
     }
     
-    response = requests.get(base_url, params=params)
-    if not response.ok:
-        raise ValueError(f"Failed to fetch weather data: {response.text}")
+    for attempt in range(_RETRY_ATTEMPTS + 1):
+        response = await httpx_client.get(base_url, params=params)
+        if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+            break
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        # Error bodies are short JSON messages; cap them so an unexpected HTML page stays readable
+        raise ValueError(
+            f"Failed to fetch weather data ({response.status_code}): {response.text[:_ERROR_SNIPPET_LENGTH]}"
+        ) from e
     
-    return response.json()
+    body = response.content
+    data = orjson.loads(body)
+    _WEATHER_CACHE.pop(cache_key, None)
+    if len(_WEATHER_CACHE) >= _WEATHER_CACHE_MAXSIZE:
+        # Evict the oldest entry; dicts keep insertion order
+        del _WEATHER_CACHE[next(iter(_WEATHER_CACHE))]
+    # Read on the miss path so values loaded from .env after import still apply;
+    # each distinct raw value is parsed (and warned about) only once
+    ttl = _parse_cache_ttl(os.environ.get("WEATHER_CACHE_TTL"))
+    _WEATHER_CACHE[cache_key] = (time.monotonic() + ttl, body)
+    return data
+
+
+# Readable summary returned by the weather tools
+_WEATHER_TEMPLATE = (
+    "Current weather in {location}, {region}, {country} (Local time: {local_time}):\n"
+    "• Temperature: {temperature}°C (feels like {feels_like}°C)\n"
+    "• Conditions: {conditions}\n"
+    "• Humidity: {humidity}%\n"
+    "• Wind: {wind_speed} km/h from {wind_direction}\n"
+    "• UV Index: {uv_index}\n"
+    "• Air Quality Index (US EPA): {air_quality}"
+)
+
+
+async def _describe_weather(location: str) -> str:
+    """Fetch the weather for one location and format it as a readable summary, or an apology on failure."""
+    try:
+        data = await fetch_weather_data(location)
+        current = data["current"]
+        location_data = data["location"]
+        try:
+            air_quality = current["air_quality"]["us-epa-index"]
+        except KeyError:
+            air_quality = "N/A"
+        
+        return _WEATHER_TEMPLATE.format(
+            location=location_data["name"],
+            region=location_data["region"],
+            country=location_data["country"],
+            local_time=location_data["localtime"],
+            temperature=round(current["temp_c"]),
+            feels_like=round(current["feelslike_c"]),
+            conditions=current["condition"]["text"],
+            humidity=current["humidity"],
+            wind_speed=round(current["wind_kph"]),
+            wind_direction=current["wind_dir"],
+            uv_index=current["uv"],
+            air_quality=air_quality
+        )
+    except Exception as e:
+        return f"Sorry, I couldn't fetch the weather data for {location}. Error: {str(e)}"
 
 
 @tool
-def get_weather(location: str) -> str:
+async def get_weather(location: str) -> str:
     """Get the current weather for a specific location.
     
     Args:
@@ -43,53 +160,51 @@ def get_weather(location: str) -> str:
     Returns:
         A formatted string containing the current weather information
     """
-    try:
-        data = fetch_weather_data(location)
-        current = data["current"]
-        location_data = data["location"]
-        
-        # Extract relevant weather information
-        weather_info = {
-            "location": location_data["name"],
-            "country": location_data["country"],
-            "region": location_data["region"],
-            "local_time": location_data["localtime"],
-            "temperature": {
-                "current": round(current["temp_c"]),
-                "feels_like": round(current["feelslike_c"]),
-                "unit": "°C"
-            },
-            "conditions": current["condition"]["text"],
-            "humidity": current["humidity"],
-            "wind": {
-                "speed": round(current["wind_kph"]),
-                "direction": current["wind_dir"],
-                "unit": "km/h"
-            },
-            "uv_index": current["uv"],
-            "air_quality": current.get("air_quality", {}).get("us-epa-index", "N/A")
-        }
-        
-        # Format the weather information into a readable string
-        weather_str = (
-            f"Current weather in {weather_info['location']}, {weather_info['region']}, {weather_info['country']} "
-            f"(Local time: {weather_info['local_time']}):\n"
-            f"• Temperature: {weather_info['temperature']['current']}°C "
-            f"(feels like {weather_info['temperature']['feels_like']}°C)\n"
-            f"• Conditions: {weather_info['conditions']}\n"
-            f"• Humidity: {weather_info['humidity']}%\n"
-            f"• Wind: {weather_info['wind']['speed']} {weather_info['wind']['unit']} from {weather_info['wind']['direction']}\n"
-            f"• UV Index: {weather_info['uv_index']}\n"
-            f"• Air Quality Index (US EPA): {weather_info['air_quality']}"
-        )
-        
-        return weather_str
-    except Exception as e:
-        return f"Sorry, I couldn't fetch the weather data for {location}. Error: {str(e)}"
+    return await _describe_weather(location)
+
+
+@tool
+async def get_weather_batch(locations: List[str]) -> List[str]:
+    """Get the current weather for several locations at once.
+    
+    The lookups run concurrently (a few at a time), so prefer this over repeated get_weather calls
+    when comparing cities.
+    
+    Args:
+        locations: The city names to get weather for (e.g., ["London", "Paris", "Tokyo"])
+    
+    Returns:
+        A list of formatted weather strings, one per location in the same order
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    
+    async def describe(location: str) -> str:
+        async with semaphore:
+            return await _describe_weather(location)
+    
+    return list(await asyncio.gather(*(describe(location) for location in locations)))
+
+
+# This is a mock implementation; quotes are static apart from the request timestamp
+_MOCK_STOCK_DATA = {
+    "AAPL": MappingProxyType({
+        "symbol": "AAPL",
+        "company_name": "Apple Inc.",
+        "current_price": 173.50,
+        "change": 2.35,
+        "change_percent": 1.37,
+        "volume": 52436789,
+        "market_cap": "2.73T",
+        "pe_ratio": 28.5,
+        "fifty_two_week_high": 198.23,
+        "fifty_two_week_low": 124.17
+    }),
+    # Add more mock data for other symbols as needed
+}
 
 
 @tool
-def get_stock_price(stock_symbol: str):
+async def get_stock_price(stock_symbol: str):
     """Call to get the current stock price and related information for a given stock symbol. 
     
     This is a mocked function and only supports 'AAPL'.
@@ -100,25 +215,8 @@ def get_stock_price(stock_symbol: str):
     Returns:
         Dictionary containing stock information or error message
     """
-    # This is a mock implementation
-    mock_stock_data = {
-        "AAPL": {
-            "symbol": "AAPL",
-            "company_name": "Apple Inc.",
-            "current_price": 173.50,
-            "change": 2.35,
-            "change_percent": 1.37,
-            "volume": 52436789,
-            "market_cap": "2.73T",
-            "pe_ratio": 28.5,
-            "fifty_two_week_high": 198.23,
-            "fifty_two_week_low": 124.17,
-            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        },
-        # Add more mock data for other symbols as needed
-    }
-    
-    if stock_symbol in mock_stock_data:
-        return mock_stock_data[stock_symbol]
+    data = _MOCK_STOCK_DATA.get(stock_symbol)
+    if data is not None:
+        return {**data, "timestamp": utc_now_iso()}
     
-    return {"error": f"Stock price for {stock_symbol} not found. Only 'AAPL' is supported in this mock."} 
\ No newline at end of file
+    return {"error": f"Stock price for {stock_symbol} not found. Only 'AAPL' is supported in this mock."}
\ No newline at end of file